@@ -13,6 +13,7 @@ GRID_SIZE = 32
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
 FPS = 60
+MENU_FPS = 30  # Frame cap for the static menu-like screens
 
 # Colors
 WHITE = (255, 255, 255)
@@ -9,6 +9,9 @@ from sniper.config.constants import const
 class SniperType:
     """Class representing a type of sniper with specific abilities."""
     
+    __slots__ = ('name', 'sprite', 'color', 'description', 'move_limit', 'special_power',
+                 'highlight_color')
+    
     def __init__(self, name: str, sprite: pygame.Surface, color: Tuple[int, int, int], 
                  description: str, move_limit: int, special_power: str):
         """Initialize a new sniper type."""
@@ -18,11 +21,19 @@ class SniperType:
         self.description = description
         self.move_limit = move_limit
         self.special_power = special_power
+        # Semi-transparent movement range tint, resolved once per type
+        self.highlight_color = (*color[:3], 50)
 
 
 class Character:
     """Class representing a character in the game (player or enemy)."""
     
+    __slots__ = (
+        'x', 'y', 'sniper_type', 'health', 'shots_left', 'moves_left', 'is_player',
+        'show_range', 'experience', 'level', 'courage', 'last_proximity_time', 'facing',
+        '_range_key', '_range_surface', '_range_origin'
+    )
+    
     def __init__(self, x: int, y: int, sniper_type: SniperType, is_player: bool = True):
         """Initialize a new character."""
         self.x = x
@@ -43,6 +54,16 @@ class Character:
         self.last_proximity_time = 0  # Track when courage was last gained from proximity
         # Facing direction for abilities (dx, dy)
         self.facing = (0, -1)
+        
+        # Cached movement range overlay, rebuilt when position/range changes
+        self._range_key = None
+        self._range_surface = None
+        self._range_origin = (0, 0)
+    
+    def render_state(self) -> tuple:
+        """Return the attributes that affect how this character appears on screen and in the HUD."""
+        return (self.x, self.y, self.health, self.moves_left, self.shots_left,
+                self.courage, self.level, self.show_range, self.facing)
     
     def start_turn(self):
         """Reset character for a new turn."""
@@ -53,7 +74,6 @@ class Character:
         """
         Consume courage to place a bush. Returns True if used.
         """
-        from sniper.config.constants import const
         if self.courage >= const.COURAGE_BUSH_COST:
             self.courage -= const.COURAGE_BUSH_COST
             return True
@@ -61,18 +81,16 @@ class Character:
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the character on the surface."""
-        rect = pygame.Rect(
-            int(self.x) * const.GRID_SIZE, 
-            int(self.y) * const.GRID_SIZE,
-            const.GRID_SIZE, 
-            const.GRID_SIZE
-        )
+        grid_size = const.GRID_SIZE
+        rect = (int(self.x) * grid_size, int(self.y) * grid_size, grid_size, grid_size)
         
         # Draw character sprite if available, otherwise use a colored rectangle
-        if hasattr(self.sniper_type, 'sprite') and self.sniper_type.sprite:
-            surface.blit(self.sniper_type.sprite, rect)
+        # (SniperType always defines sprite, so a plain truthiness check is enough)
+        sniper_type = self.sniper_type
+        if sniper_type.sprite:
+            surface.blit(sniper_type.sprite, rect)
         else:
-            pygame.draw.rect(surface, self.sniper_type.color, rect)
+            pygame.draw.rect(surface, sniper_type.color, rect)
     
     def draw_range(self, surface: pygame.Surface) -> None:
         """Draw the movement range if shown."""
@@ -81,26 +99,48 @@ class Character:
             int_x, int_y = int(self.x), int(self.y)
             moves_left = int(self.moves_left)  # Ensure moves_left is also an integer
             
-            for x in range(max(0, int_x - moves_left), min(const.GRID_WIDTH, int_x + moves_left + 1)):
-                for y in range(max(0, int_y - moves_left), min(const.GRID_HEIGHT, int_y + moves_left + 1)):
-                    # Skip positions that are out of range (using Manhattan distance)
-                    if abs(x - int_x) + abs(y - int_y) <= moves_left:
-                        highlight_rect = pygame.Rect(
-                            x * const.GRID_SIZE, 
-                            y * const.GRID_SIZE,
-                            const.GRID_SIZE, 
-                            const.GRID_SIZE
-                        )
-                        highlight_surface = pygame.Surface(
-                            (const.GRID_SIZE, const.GRID_SIZE), 
-                            pygame.SRCALPHA
-                        )
-                        pygame.draw.rect(
-                            highlight_surface, 
-                            (*self.sniper_type.color[:3], 50),  # Semi-transparent color
-                            highlight_surface.get_rect()
-                        )
-                        surface.blit(highlight_surface, highlight_rect)
+            # Only rebuild the overlay when something that affects it has changed
+            range_key = (int_x, int_y, moves_left, self.sniper_type.highlight_color)
+            if range_key != self._range_key:
+                self._range_surface, self._range_origin = self._build_range_surface(int_x, int_y, moves_left)
+                self._range_key = range_key
+            
+            surface.blit(self._range_surface, self._range_origin)
+    
+    def _build_range_surface(self, int_x: int, int_y: int, moves_left: int) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Render the movement range highlight into a single overlay surface."""
+        # Bind grid constants once rather than looking them up on const per row
+        grid_size = const.GRID_SIZE
+        min_x = max(0, int_x - moves_left)
+        max_x = min(const.GRID_WIDTH, int_x + moves_left + 1)
+        min_y = max(0, int_y - moves_left)
+        max_y = min(const.GRID_HEIGHT, int_y + moves_left + 1)
+        
+        overlay = pygame.Surface(
+            ((max_x - min_x) * grid_size, (max_y - min_y) * grid_size),
+            pygame.SRCALPHA
+        )
+        
+        # Semi-transparent color, written straight into the overlay
+        highlight_color = self.sniper_type.highlight_color
+        
+        # Cells within Manhattan distance form a diamond, so each row is one
+        # contiguous span of width 2 * (moves_left - |dy|) + 1 - fill it in one go
+        for y in range(min_y, max_y):
+            half_width = moves_left - abs(y - int_y)
+            row_min_x = max(min_x, int_x - half_width)
+            row_max_x = min(max_x, int_x + half_width + 1)
+            if row_min_x >= row_max_x:
+                continue
+            highlight_rect = pygame.Rect(
+                (row_min_x - min_x) * grid_size,
+                (y - min_y) * grid_size,
+                (row_max_x - row_min_x) * grid_size,
+                grid_size
+            )
+            overlay.fill(highlight_color, highlight_rect)
+        
+        return overlay, (min_x * grid_size, min_y * grid_size)
     
     def add_experience(self, amount: int) -> bool:
         """
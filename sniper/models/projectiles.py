@@ -9,6 +9,8 @@ from sniper.config.constants import const
 class Projectile:
     """Class representing a projectile (bullet) in the game."""
     
+    __slots__ = ('x', 'y', 'dx', 'dy', 'color', 'owner')
+    
     def __init__(self, x: float, y: float, dx: float, dy: float, 
                 color: Tuple[int, int, int], owner=None):
         """Initialize a new projectile."""
@@ -4,11 +4,38 @@ Scenario Objects module for the Sniper Game.
 This module contains classes for scenario objects like asteroids/obstacles
 with health states and animation capabilities.
 """
-import time
+import random
 import pygame
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 from sniper.config.constants import const, debug_print
+from sniper.utils import load_image
+
+# Crack lines drawn on damaged asteroids by remaining health, as (start, end)
+# offsets from the center in units of half the asteroid radius
+_CRACKS_BY_HEALTH = {
+    2: (((-1, -1), (1, 1)),),                     # Damaged - one big crack
+    1: (((-1, -1), (1, 1)), ((1, -1), (-1, 1))),  # Critical - two big cracks
+}
+
+# Asteroid color for each health value from 0 up to BLOCK_MAX_HEALTH
+_COLOR_BY_HEALTH = tuple(
+    const.ASTEROID_HEALTHY if health >= const.BLOCK_MAX_HEALTH
+    else const.ASTEROID_DAMAGED if health == 2
+    else const.ASTEROID_CRITICAL
+    for health in range(const.BLOCK_MAX_HEALTH + 1)
+)
+
+# Darker shade of the asteroid color for craters and cracks: slightly darker on a
+# healthy asteroid, more contrast once it is damaged
+_DETAIL_COLOR_BY_HEALTH = tuple(
+    tuple(max(0, channel - (20 if health >= const.BLOCK_MAX_HEALTH else 30)) for channel in color)
+    for health, color in enumerate(_COLOR_BY_HEALTH)
+)
+
+# Alpha change per millisecond of the fade out and fade in animations
+_FADE_ALPHA_PER_MS = 255 / const.BLOCK_FADE_DURATION
+_APPEAR_ALPHA_PER_MS = 255 / const.BLOCK_APPEAR_DURATION
 
 class Block:
     """
@@ -16,6 +43,12 @@ class Block:
     and animation capabilities.
     """
     
+    __slots__ = (
+        'x', 'y', 'health', 'is_fading', 'is_appearing', 'animation_start_time', 'alpha',
+        'is_bush', 'owner', 'rotation', 'size_factor', '_craters', '_cached_surface',
+        '_cached_health', '_screen_pos', '_tree_blit_pos', '_glow_blit_pos'
+    )
+    
     def __init__(self, x: int, y: int):
         """Initialize an asteroid with position and full health."""
         self.x = x
@@ -28,11 +61,35 @@ class Block:
         self.animation_start_time = 0
         self.alpha = 255  # Full opacity
         
+        # Bushes are blocks placed by a player ('player') or the AI ('enemy')
+        self.is_bush = False
+        self.owner = None
+        # Where a bush's tree and glow are blitted, set by the scenario when the bush is placed
+        self._tree_blit_pos = None
+        self._glow_blit_pos = None
+        
         # Random rotation for asteroid appearance
-        import random
         self.rotation = random.randint(0, 360)
         # Random size variation (0.7 to 1.0 of grid size)
         self.size_factor = 0.7 + random.random() * 0.3
+        
+        # Crater layout is rolled once so the asteroid looks the same every frame
+        size = int(const.GRID_SIZE * self.size_factor)
+        center = size // 2
+        radius = size // 2 - 2
+        self._craters = [
+            ((center + random.randint(-radius//2, radius//2),
+              center + random.randint(-radius//2, radius//2)),
+             random.randint(2, 5))
+            for _ in range(random.randint(2, 3))
+        ]
+        
+        # Fully opaque render of the asteroid, rebuilt only when its health changes
+        self._cached_surface = None
+        self._cached_health = None
+        # Top-left pixel position that centers the asteroid in its grid cell
+        self._screen_pos = (x * const.GRID_SIZE + (const.GRID_SIZE - size) // 2,
+                            y * const.GRID_SIZE + (const.GRID_SIZE - size) // 2)
     
     @property
     def position(self) -> Tuple[int, int]:
@@ -47,12 +104,8 @@ class Block:
     @property
     def color(self) -> Tuple[int, int, int]:
         """Get the color based on the asteroid's health."""
-        if self.health >= const.BLOCK_MAX_HEALTH:
-            return const.ASTEROID_HEALTHY
-        elif self.health == 2:
-            return const.ASTEROID_DAMAGED
-        else:
-            return const.ASTEROID_CRITICAL
+        # Clamp into the table so overhealed or destroyed blocks still map to a color
+        return _COLOR_BY_HEALTH[min(max(self.health, 0), const.BLOCK_MAX_HEALTH)]
     
     def take_damage(self, damage: int = 1) -> bool:
         """
@@ -66,116 +119,118 @@ class Block:
         """Start the fade out animation."""
         self.is_fading = True
         self.is_appearing = False
-        self.animation_start_time = time.time() * 1000  # Current time in ms
+        self.animation_start_time = pygame.time.get_ticks()  # Current time in ms
         debug_print(f"Asteroid at {self.position} starting fade out")
     
     def start_fade_in(self):
         """Start the fade in animation."""
         self.is_appearing = True
         self.is_fading = False
-        self.animation_start_time = time.time() * 1000  # Current time in ms
+        self.animation_start_time = pygame.time.get_ticks()  # Current time in ms
         self.alpha = 0  # Start completely transparent
         debug_print(f"Asteroid at {self.position} starting fade in")
     
-    def update_animation(self) -> bool:
+    def update_animation(self, current_time: Optional[int] = None) -> bool:
         """
         Update the animation state and return True if the animation is complete.
+        
+        Args:
+            current_time: Frame timestamp in ms, read from the clock when omitted
         """
         if not (self.is_fading or self.is_appearing):
             return True
         
-        current_time = time.time() * 1000
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+        
+        elapsed = current_time - self.animation_start_time
         
         if self.is_fading:
-            # Calculate alpha based on elapsed time
-            progress = min(1.0, (current_time - self.animation_start_time) / const.BLOCK_FADE_DURATION)
-            self.alpha = int(255 * (1.0 - progress))
-            
             # Check if fade out is complete
-            if progress >= 1.0:
+            if elapsed >= const.BLOCK_FADE_DURATION:
                 self.is_fading = False
                 self.alpha = 0
                 return True
+            
+            # Calculate alpha based on elapsed time; a frame timestamp taken just before
+            # the fade started gives a slightly negative elapsed time, so clamp at 255
+            self.alpha = min(255, int(255 - elapsed * _FADE_ALPHA_PER_MS))
         
         elif self.is_appearing:
-            # Calculate alpha based on elapsed time
-            progress = min(1.0, (current_time - self.animation_start_time) / const.BLOCK_APPEAR_DURATION)
-            self.alpha = int(255 * progress)
-            
             # Check if fade in is complete
-            if progress >= 1.0:
+            if elapsed >= const.BLOCK_APPEAR_DURATION:
                 self.is_appearing = False
                 self.alpha = 255
                 return True
+            
+            # Calculate alpha based on elapsed time, clamped at 0 the same way
+            self.alpha = max(0, int(elapsed * _APPEAR_ALPHA_PER_MS))
         
         return False
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the asteroid on the surface with appropriate health state and animation."""
-        # Create a transparent surface for animation
+        surface.blit(*self.get_blit())
+    
+    def get_blit(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Return the (surface, position) pair that draws this asteroid, so callers
+        can batch many asteroids into a single Surface.blits call.
+        """
+        if self._cached_health != self.health:
+            self._cached_surface = self._render_to_surface()
+            self._cached_health = self.health
+        
+        # Apply alpha for animations on the cached render
+        asteroid_surface = self._cached_surface
+        if asteroid_surface.get_alpha() != self.alpha:
+            asteroid_surface.set_alpha(self.alpha)
+        
+        # Positioned to center the asteroid in its grid cell
+        return asteroid_surface, self._screen_pos
+    
+    def _render_to_surface(self) -> pygame.Surface:
+        """Render the asteroid at full opacity for its current health state."""
+        # Create a transparent surface for the asteroid
         size = int(const.GRID_SIZE * self.size_factor)
         asteroid_surface = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Get base color based on health
         base_color = self.color
         
-        # Apply alpha for animations
-        color_with_alpha = (*base_color, self.alpha)
-        
         # Draw the asteroid with irregular shape instead of a rectangle
         center = (size // 2, size // 2)
         radius = size // 2 - 2
         
         # Draw main asteroid body (circle)
-        pygame.draw.circle(asteroid_surface, color_with_alpha, center, radius)
+        pygame.draw.circle(asteroid_surface, base_color, center, radius)
         
         # Add some crater details
         if self.health == const.BLOCK_MAX_HEALTH:
             # Healthy asteroid - just a few small craters
-            crater_color = (max(0, base_color[0] - 20), 
-                           max(0, base_color[1] - 20), 
-                           max(0, base_color[2] - 20), 
-                           self.alpha)
+            crater_color = _DETAIL_COLOR_BY_HEALTH[self.health]
             
-            # Add 2-3 small craters with 50% opacity
-            import random
-            for _ in range(random.randint(2, 3)):
-                crater_pos = (
-                    center[0] + random.randint(-radius//2, radius//2),
-                    center[1] + random.randint(-radius//2, radius//2)
-                )
-                crater_size = random.randint(2, 5)
+            # Add the 2-3 small craters rolled at creation
+            for crater_pos, crater_size in self._craters:
                 pygame.draw.circle(asteroid_surface, crater_color, crater_pos, crater_size)
         
         # Add visual indicators for damaged state
         elif self.health < const.BLOCK_MAX_HEALTH and self.health > 0:
             # Darker crater color for more contrast
-            crater_color = (max(0, base_color[0] - 30), 
-                           max(0, base_color[1] - 30), 
-                           max(0, base_color[2] - 30), 
-                           self.alpha)
+            crater_color = _DETAIL_COLOR_BY_HEALTH[self.health]
             
-            if self.health == 2:  # Damaged - one big crack
-                pygame.draw.line(asteroid_surface, crater_color, 
-                                (center[0] - radius//2, center[1] - radius//2), 
-                                (center[0] + radius//2, center[1] + radius//2), 
-                                3)
-            elif self.health == 1:  # Critical - two big cracks
-                pygame.draw.line(asteroid_surface, crater_color, 
-                                (center[0] - radius//2, center[1] - radius//2), 
-                                (center[0] + radius//2, center[1] + radius//2), 
-                                3)
+            half = radius // 2
+            for (start_x, start_y), (end_x, end_y) in _CRACKS_BY_HEALTH.get(self.health, ()):
                 pygame.draw.line(asteroid_surface, crater_color, 
-                                (center[0] + radius//2, center[1] - radius//2), 
-                                (center[0] - radius//2, center[1] + radius//2), 
+                                (center[0] + start_x * half, center[1] + start_y * half), 
+                                (center[0] + end_x * half, center[1] + end_y * half), 
                                 3)
         
-        # Calculate position to center the asteroid in the grid cell
-        x = self.x * const.GRID_SIZE + (const.GRID_SIZE - size) // 2
-        y = self.y * const.GRID_SIZE + (const.GRID_SIZE - size) // 2
+        # Match the display's pixel format so blits take SDL's fast path
+        if pygame.display.get_surface() is not None:
+            asteroid_surface = asteroid_surface.convert_alpha()
         
-        # Blit the asteroid surface onto the main surface
-        surface.blit(asteroid_surface, (x, y))
+        return asteroid_surface
 
 
 class ScenarioManager:
@@ -186,18 +241,35 @@ class ScenarioManager:
         """Initialize with the given population size."""
         self.population = population
         self.blocks = []
-        # Bush blocks are special obstacles placed by players or AI
-        # Each block may have attributes: is_bush (bool) and owner ('player'/'enemy')
-        for block in self.blocks:
-            setattr(block, 'is_bush', False)
-            setattr(block, 'owner', None)
+        # Index of blocks by grid position, kept in sync with self.blocks
+        self._block_at: Dict[Tuple[int, int], Block] = {}
+        # Blocks with a fade in progress mapped to whether they are fading out,
+        # so idle blocks are never visited per frame
+        self._animating: Dict[Block, bool] = {}
+        # Asteroids (not bushes) still fading out or in, so the round transition
+        # can check for the end of a phase without scanning every block
+        self._fading_count = 0
+        self._appearing_count = 0
+        # Bumped whenever blocks are added, replaced or damaged so callers can detect changes
+        self.revision = 0
+        # Bush glow surfaces by tint - identical for every bush of the same owner
+        self._bush_glows: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        # Bush health labels by health value as (text, background) surfaces, and their font
+        self._health_labels: Dict[int, Tuple[pygame.Surface, pygame.Surface]] = {}
+        self.font = None
+        # Obstacle positions cached for the revision they were built at
+        self._obstacles: List[Tuple[int, int]] = []
+        self._obstacles_revision = -1
+        # Blits that draw the scenario, rebuilt only when the blocks change
+        self._draw_batch: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._draw_batch_revision = -1
         self.round_transition_active = False
         self.transition_start_time = 0
         self.fade_phase_complete = False
         
         # Load tree image
         try:
-            self.tree_image = pygame.image.load("assets/tree.png").convert_alpha()
+            self.tree_image = load_image("tree.png")
             # Scale it to fit in a grid cell with slight overflow
             scale_size = int(const.GRID_SIZE * 1.1)  # 110% of grid size for slight overflow
             self.tree_image = pygame.transform.scale(self.tree_image, (scale_size, scale_size))
@@ -205,7 +277,7 @@ class ScenarioManager:
         except (pygame.error, FileNotFoundError):
             print("Warning: Could not load tree.png, trying tree_no_bg.png")
             try:
-                self.tree_image = pygame.image.load("assets/tree_no_bg.png").convert_alpha()
+                self.tree_image = load_image("tree_no_bg.png")
                 # Scale it to fit in a grid cell with slight overflow
                 scale_size = int(const.GRID_SIZE * 1.1)  # 110% of grid size for slight overflow
                 self.tree_image = pygame.transform.scale(self.tree_image, (scale_size, scale_size))
@@ -220,22 +292,80 @@ class ScenarioManager:
         Returns True if placed successfully.
         """
         # Don't place if occupied
-        if any(block.position == (x, y) for block in self.blocks):
+        if (x, y) in self._block_at:
             return False
         bush = Block(x, y)
         bush.is_bush = True
         bush.owner = owner
-        self.blocks.append(bush)
+        if self.tree_loaded:
+            # Center the tree in the grid cell with slight overflow, glow just around it
+            bush._tree_blit_pos = (x * const.GRID_SIZE + (const.GRID_SIZE - self.tree_image.get_width()) // 2,
+                                   y * const.GRID_SIZE + (const.GRID_SIZE - self.tree_image.get_height()) // 2)
+            bush._glow_blit_pos = (x * const.GRID_SIZE - const.BUSH_GLOW_MARGIN,
+                                   y * const.GRID_SIZE - const.BUSH_GLOW_MARGIN)
+        self._add_block(bush)
         debug_print(f"Bush placed at {(x, y)} for {owner}")
         return True
     
+    def _add_block(self, block: Block) -> None:
+        """Append a block to the scenario and index it by position."""
+        self.blocks.append(block)
+        self._block_at[block.position] = block
+        if block.is_fading or block.is_appearing:
+            self._begin_animation(block)
+        self.revision += 1
+    
+    def _set_blocks(self, blocks: List[Block]) -> None:
+        """Replace the scenario's blocks and rebuild the position index."""
+        self.blocks = list(blocks)
+        self._block_at = {block.position: block for block in self.blocks}
+        self._animating = {}
+        self._fading_count = self._appearing_count = 0
+        for block in self.blocks:
+            if block.is_fading or block.is_appearing:
+                self._begin_animation(block)
+        self.revision += 1
+    
+    def _begin_animation(self, block: Block) -> None:
+        """Track a block whose fade has just started."""
+        self._end_animation(block)
+        self._animating[block] = block.is_fading
+        if not block.is_bush:
+            if block.is_fading:
+                self._fading_count += 1
+            else:
+                self._appearing_count += 1
+    
+    def _end_animation(self, block: Block) -> None:
+        """Stop tracking a block whose fade has finished or been cut short."""
+        if block not in self._animating:
+            return
+        was_fading = self._animating.pop(block)
+        # A destroyed block drops out of the drawing once its fade ends
+        self._draw_batch_revision = -1
+        if not block.is_bush:
+            if was_fading:
+                self._fading_count -= 1
+            else:
+                self._appearing_count -= 1
+    
+    @property
+    def is_animating(self) -> bool:
+        """Check if a round transition or any block fade is in progress."""
+        return self.round_transition_active or bool(self._animating)
+    
     @property
     def obstacles(self) -> list:
         """
         Return list of block positions for collision detection.
         Only includes blocks that aren't destroyed.
+        
+        The list is cached until the blocks change, so callers must not modify it.
         """
-        return [block.position for block in self.blocks if not block.is_destroyed]
+        if self._obstacles_revision != self.revision:
+            self._obstacles = [block.position for block in self.blocks if not block.is_destroyed]
+            self._obstacles_revision = self.revision
+        return self._obstacles
     
     def get_obstacles(self) -> list:
         """Get the list of current obstacle positions for pathfinding/collision."""
@@ -243,30 +373,33 @@ class ScenarioManager:
         
     def is_obstacle(self, x: int, y: int) -> bool:
         """Check if there is an obstacle at the given position."""
-        pos = (int(x), int(y))
-        return pos in self.obstacles
+        # Look up the position index instead of building the obstacle list
+        block = self._block_at.get((int(x), int(y)))
+        return block is not None and not block.is_destroyed
     
     def generate_scenario(self, player_pos: Tuple[int, int], enemy_pos: Tuple[int, int]) -> None:
         """Generate a new scenario with blocks at random positions."""
-        import random
-        self.blocks = []
+        self._set_blocks([])
         
-        # Add blocks up to the population size
-        attempts = 0
-        while len(self.blocks) < self.population and attempts < self.population * 3:
-            attempts += 1
-            x = random.randint(0, const.GRID_WIDTH - 1)
-            y = random.randint(0, const.GRID_HEIGHT - 1)
-            
-            # Don't place blocks on players or existing blocks
-            if ((x, y) == player_pos or (x, y) == enemy_pos or 
-                any(block.position == (x, y) for block in self.blocks)):
-                continue
-                
+        # Add blocks up to the population size, never on players or existing blocks
+        for x, y in self._sample_free_cells(self.population, {player_pos, enemy_pos}):
             # Create a new block and add it to the list
             block = Block(x, y)
             block.start_fade_in()  # Start with fade-in animation
-            self.blocks.append(block)
+            self._add_block(block)
+    
+    def _sample_free_cells(self, count: int, excluded) -> List[Tuple[int, int]]:
+        """
+        Pick up to count distinct random grid cells that hold no block and are not excluded.
+        Sampling the free cells directly avoids retrying random picks that land on taken cells.
+        """
+        free_cells = [
+            (x, y)
+            for x in range(const.GRID_WIDTH)
+            for y in range(const.GRID_HEIGHT)
+            if (x, y) not in self._block_at and (x, y) not in excluded
+        ]
+        return random.sample(free_cells, min(count, len(free_cells)))
     
     def handle_projectile_collision(self, x: int, y: int, projectile=None) -> bool:
         """
@@ -278,45 +411,53 @@ class ScenarioManager:
             y: Y position to check
             projectile: Optional projectile object that includes owner information
         """
-        for block in self.blocks:
-            if block.position == (int(x), int(y)) and not block.is_destroyed:
-                # Check if this is a player-owned bush and the shooter is also the player
-                # If so, allow the shot to pass through
-                if getattr(block, 'is_bush', False) and getattr(block, 'owner', None) == 'player' and projectile and getattr(projectile.owner, 'is_player', False):
-                    # Skip collision for player shots hitting player's own bushes
-                    debug_print(f"Player shot passing through player's own bush at {block.position}")
-                    return False
-                
-                # Otherwise, damage the block (whether it's a regular obstacle or an enemy bush)
-                destroyed = block.take_damage(const.BLOCK_DAMAGE_PER_HIT)
-                return True
-        return False
+        # Positions are unique per block, so a single lookup replaces a scan
+        block = self._block_at.get((int(x), int(y)))
+        if block is None or block.is_destroyed:
+            return False
+        
+        # Check if this is a player-owned bush and the shooter is also the player
+        # If so, allow the shot to pass through
+        if block.is_bush and block.owner == 'player' and projectile and getattr(projectile.owner, 'is_player', False):
+            # Skip collision for player shots hitting player's own bushes
+            debug_print(f"Player shot passing through player's own bush at {block.position}")
+            return False
+        
+        # Otherwise, damage the block (whether it's a regular obstacle or an enemy bush)
+        destroyed = block.take_damage(const.BLOCK_DAMAGE_PER_HIT)
+        self.revision += 1
+        return True
     
     def start_round_transition(self) -> None:
         """Start the round transition animation."""
         self.round_transition_active = True
-        self.transition_start_time = time.time() * 1000
+        self.transition_start_time = pygame.time.get_ticks()
         self.fade_phase_complete = False
         
         # Start fade out animation for all blocks
         for block in self.blocks:
             if not block.is_destroyed:
                 block.start_fade_out()
+                self._begin_animation(block)
         
         debug_print("Starting round transition - fade out phase")
     
-    def update_round_transition(self, player_pos: Tuple[int, int], enemy_pos: Tuple[int, int]) -> bool:
+    def update_round_transition(self, player_pos: Tuple[int, int], enemy_pos: Tuple[int, int],
+                                current_time: Optional[int] = None) -> bool:
         """
         Update the round transition animation.
         Returns True when the transition is complete.
+        
+        Args:
+            player_pos: Player grid position, kept clear of new blocks
+            enemy_pos: Enemy grid position, kept clear of new blocks
+            current_time: Frame timestamp in ms, read from the clock when omitted
         """
         if not self.round_transition_active:
             return True
         
-        # Backup any existing bush blocks so they persist across rounds
-        bush_blocks = [block for block in self.blocks if getattr(block, 'is_bush', False)]
-         
-        current_time = time.time() * 1000
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         elapsed = current_time - self.transition_start_time
         
         # Log transition progress every second
@@ -328,28 +469,28 @@ class ScenarioManager:
         # Phase 1: Wait for all blocks to fade out
         if not self.fade_phase_complete:
             # Check if any non-bush blocks are still fading
-            non_bush_blocks = [b for b in self.blocks if not getattr(b, 'is_bush', False)]
-            fading_blocks = [b for b in non_bush_blocks if b.is_fading]
+            fading_count = self._fading_count
             
             # Debug the fade-out progress more frequently
-            if len(fading_blocks) > 0 and (elapsed % 500 < 20):  # Log approximately every 500ms
-                debug_print(f"[{elapsed:.0f}ms] Waiting for {len(fading_blocks)} blocks to finish fading out")
+            if fading_count > 0 and (elapsed % 500 < 20):  # Log approximately every 500ms
+                debug_print(f"[{elapsed:.0f}ms] Waiting for {fading_count} blocks to finish fading out")
             
             # Force fade-out completion after sufficient time has elapsed (reduced timeout)
             time_to_force = const.BLOCK_FADE_DURATION + 200  # Add a small buffer
             
             # Determine if fade phase is complete
-            all_faded = len(fading_blocks) == 0
+            all_faded = fading_count == 0
             force_complete = elapsed >= time_to_force
             
             if all_faded or force_complete:
                 if force_complete:
                     print(f"[{elapsed:.0f}ms] Force completing fade-out phase due to timeout")
                     # Force any remaining blocks to complete fading
-                    for block in self.blocks:
+                    for block in list(self._animating):
                         if block.is_fading:
                             block.is_fading = False
                             block.alpha = 0
+                            self._end_animation(block)
                 
                 self.fade_phase_complete = True
                 print(f"[{elapsed:.0f}ms] Fade-out phase complete, regenerating blocks")
@@ -359,98 +500,70 @@ class ScenarioManager:
                 self.transition_start_time = current_time
                 
                 # Regenerate blocks with new positions
-                import random
-                
-                # Keep track of which non-bush blocks are still alive
-                healthy = [b for b in self.blocks if not b.is_destroyed and not getattr(b, 'is_bush', False)]
-                destroyed = [b for b in self.blocks if b.is_destroyed and not getattr(b, 'is_bush', False)]
+                # In one pass, back up bush blocks so they persist across rounds and
+                # keep track of which non-bush blocks are still alive
+                bush_blocks = []
+                healthy = []
+                for b in self.blocks:
+                    if b.is_bush:
+                        bush_blocks.append(b)
+                    elif not b.is_destroyed:
+                        healthy.append(b)
                 # Reset block list to start fresh, re-add bush blocks
-                self.blocks = list(bush_blocks)
-                
-                # Make sure positions are integers
-                player_pos_int = (int(player_pos[0]), int(player_pos[1]))
-                enemy_pos_int = (int(enemy_pos[0]), int(enemy_pos[1]))
-                
-                # Create buffer zones around characters to prevent blocks from being too close
-                protected_positions = [
-                    player_pos_int,
-                    enemy_pos_int,
-                    # Add adjacent positions to prevent rocks too close to characters
-                    (player_pos_int[0] + 1, player_pos_int[1]),
-                    (player_pos_int[0] - 1, player_pos_int[1]),
-                    (player_pos_int[0], player_pos_int[1] + 1),
-                    (player_pos_int[0], player_pos_int[1] - 1),
-                    (enemy_pos_int[0] + 1, enemy_pos_int[1]),
-                    (enemy_pos_int[0] - 1, enemy_pos_int[1]),
-                    (enemy_pos_int[0], enemy_pos_int[1] + 1),
-                    (enemy_pos_int[0], enemy_pos_int[1] - 1),
-                ]
+                self._set_blocks(bush_blocks)
                 
-                print(f"Protected positions for block generation: {protected_positions}")
+                # Create buffer zones around characters to prevent blocks from being too close:
+                # each character's cell and its on-grid neighbors
+                protected_positions = set()
+                for char_x, char_y in (player_pos, enemy_pos):
+                    # Make sure positions are integers
+                    char_x, char_y = int(char_x), int(char_y)
+                    for dx, dy in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)):
+                        x, y = char_x + dx, char_y + dy
+                        if 0 <= x < const.GRID_WIDTH and 0 <= y < const.GRID_HEIGHT:
+                            protected_positions.add((x, y))
                 
-                # Re-add healthy non-bush blocks with new positions
-                attempts = 0
-                while len(self.blocks) < len(healthy) + len(bush_blocks) and attempts < len(healthy) * 5:
-                    attempts += 1
-                    x = random.randint(0, const.GRID_WIDTH - 1)
-                    y = random.randint(0, const.GRID_HEIGHT - 1)
-                    
-                    # Don't place blocks on players, near players, or on existing blocks
-                    if ((x, y) in protected_positions or
-                        any(block.position == (x, y) for block in self.blocks)):
-                        continue
-                    
-                    # Create a new block with same health as an old one
-                    if healthy:
-                        old_block = healthy.pop(0)
-                        block = Block(x, y)
-                        block.health = old_block.health
-                        block.start_fade_in()
-                        self.blocks.append(block)
+                # Pick every new position up front, away from players and existing blocks:
+                # healthy blocks move first, destroyed ones come back to maintain population
+                free_cells = self._sample_free_cells(
+                    max(self.population, len(healthy)), protected_positions
+                )
                 
-                # Add destroyed non-bush blocks back at full health to maintain population
-                while len(self.blocks) < self.population + len(bush_blocks) and attempts < self.population * 5:
-                    attempts += 1
-                    x = random.randint(0, const.GRID_WIDTH - 1)
-                    y = random.randint(0, const.GRID_HEIGHT - 1)
-                    
-                    # Don't place blocks on players, near players, or on existing blocks
-                    if ((x, y) in protected_positions or
-                        any(block.position == (x, y) for block in self.blocks)):
-                        continue
-                    
-                    # Create a new block
+                for index, (x, y) in enumerate(free_cells):
                     block = Block(x, y)
+                    if index < len(healthy):
+                        # Create a new block with same health as an old one
+                        block.health = healthy[index].health
                     block.start_fade_in()
-                    self.blocks.append(block)
+                    self._add_block(block)
                     
                 debug_print(f"Regenerated {len(self.blocks) - len(bush_blocks)} blocks, starting fade in phase")
          
         # Phase 2: Wait for all blocks to fade in
         else:
             # Check if any non-bush blocks are still appearing
-            non_bush_blocks = [b for b in self.blocks if not getattr(b, 'is_bush', False)]
-            appearing_blocks = [b for b in non_bush_blocks if b.is_appearing]
+            appearing_count = self._appearing_count
             
-            if appearing_blocks:
-                debug_print(f"Waiting for {len(appearing_blocks)} blocks to finish fading in")
+            if appearing_count:
+                debug_print(f"Waiting for {appearing_count} blocks to finish fading in")
             
             # Check if enough time has passed since transition start
             elapsed = current_time - self.transition_start_time
             time_to_force = const.BLOCK_FADE_DURATION + const.ROUND_TRANSITION_DELAY + const.BLOCK_APPEAR_DURATION + 200
             
             # Determine if transition is complete
-            all_appeared = len(appearing_blocks) == 0
+            all_appeared = appearing_count == 0
             force_complete = elapsed >= time_to_force
              
             if all_appeared or force_complete:
                 if force_complete:
                     debug_print("Force completing fade-in phase due to timeout")
                     # Force any remaining blocks to complete appearing
-                    for block in self.blocks:
+                    for block in list(self._animating):
                         if block.is_appearing:
                             block.is_appearing = False
                             block.alpha = 255
+                            self._end_animation(block)
                 
                 self.round_transition_active = False
                 debug_print("Round transition complete")
@@ -458,54 +571,103 @@ class ScenarioManager:
          
         return False
     
-    def update_animations(self) -> None:
-        """Update all animation states for blocks without redrawing them."""
-        for block in self.blocks:
-            block.update_animation()
+    def update_animations(self, current_time: Optional[int] = None) -> None:
+        """
+        Update all animation states for blocks without redrawing them.
+        
+        Args:
+            current_time: Frame timestamp in ms, read from the clock when omitted
+        """
+        if not self._animating:
+            return
+        
+        # One timestamp for the whole frame, and only blocks with a fade in progress are visited
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+        for block in list(self._animating):
+            if block.update_animation(current_time):
+                self._end_animation(block)
+    
+    def _get_bush_glow(self, tint: Tuple[int, int, int]) -> pygame.Surface:
+        """Return the glow drawn behind bush trees for the given tint, building it once."""
+        glow_surface = self._bush_glows.get(tint)
+        if glow_surface is None:
+            margin = const.BUSH_GLOW_MARGIN
+            glow_size = const.GRID_SIZE + (margin * 2)
+            glow_surface = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+            
+            # Draw glow circles
+            center = (glow_size // 2, glow_size // 2)
+            for i in range(3, 0, -1):
+                glow_radius = const.GRID_SIZE // 2 + i
+                glow_color = (*tint, 30)
+                pygame.draw.circle(glow_surface, glow_color, center, glow_radius)
+            self._bush_glows[tint] = glow_surface
+        return glow_surface
+    
+    def _get_health_label(self, health: int) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Return the bush health text and its dark background for a health value, rendering them once."""
+        label = self._health_labels.get(health)
+        if label is None:
+            # Create font if we don't have one
+            if self.font is None:
+                self.font = pygame.font.SysFont(None, 20)
+            
+            # Render health text in white
+            health_surface = self.font.render(str(health), True, (255, 255, 255))
+            
+            # Small semi-transparent black background, slightly larger than the text
+            bg_surface = pygame.Surface((health_surface.get_width() + 4, health_surface.get_height() + 2),
+                                        pygame.SRCALPHA)
+            bg_surface.fill((0, 0, 0, 180))
+            label = self._health_labels[health] = (health_surface, bg_surface)
+        return label
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw all blocks with their appropriate visual state."""
+        if not self.tree_loaded:
+            # Fallback bushes are drawn as shapes between the blits, so nothing is kept
+            surface.blits(self._collect_blits(surface), doreturn=False)
+            return
+        
+        # With tree images every block is a plain blit, so the batch is reused until the blocks change
+        if self._draw_batch_revision != self.revision:
+            self._draw_batch = self._collect_blits(surface)
+            self._draw_batch_revision = self.revision
+        
+        # Fading asteroids keep their surface in the batch, only its alpha is updated
+        for block in self._animating:
+            if not block.is_bush:
+                block.get_blit()
+        
+        surface.blits(self._draw_batch, doreturn=False)
+    
+    def _collect_blits(self, surface: pygame.Surface) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Return the (surface, position) pairs that draw all blocks, in draw order.
+        Fallback bushes are drawn straight onto the surface, after flushing the blits before them.
+        """
+        blit_list = []
+        # Bound once since the loop below runs for every block on every frame
+        append = blit_list.append
+        tree_loaded = self.tree_loaded
         for block in self.blocks:
-            if getattr(block, 'is_bush', False):
+            if block.is_bush:
                 # Draw tree image for bushes if available, otherwise use the space-themed bush with glow effect
-                x, y = block.position
-                if hasattr(self, 'tree_loaded') and self.tree_loaded and self.tree_image:
-                    # Calculate position to center the tree in the grid cell with slight overflow
-                    tree_pos = (x * const.GRID_SIZE + (const.GRID_SIZE - self.tree_image.get_width()) // 2,
-                                y * const.GRID_SIZE + (const.GRID_SIZE - self.tree_image.get_height()) // 2)
-                    
+                x, y = block.x, block.y
+                if tree_loaded:
                     # Add a slight glow effect based on owner with smaller margin
                     tint = (80, 200, 255) if block.owner == 'player' else (200, 100, 255)
+                    glow_surface = self._get_bush_glow(tint)
                     
-                    # Use the configurable margin
-                    margin = const.BUSH_GLOW_MARGIN
-                    glow_size = const.GRID_SIZE + (margin * 2)
-                    glow_surface = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-                    
-                    # Draw glow circles
-                    center = (glow_size // 2, glow_size // 2)
-                    for i in range(3, 0, -1):
-                        glow_radius = const.GRID_SIZE // 2 + i
-                        glow_color = (*tint, 30)
-                        pygame.draw.circle(glow_surface, glow_color, center, glow_radius)
-                    
-                    # Draw the glow around the tree with the specified margin
-                    glow_pos = (x * const.GRID_SIZE - margin, y * const.GRID_SIZE - margin)
-                    surface.blit(glow_surface, glow_pos)
-                    
-                    # Draw the tree image
-                    surface.blit(self.tree_image, tree_pos)
+                    # Draw the glow around the tree, then the tree image, at the
+                    # positions worked out when the bush was placed
+                    append((glow_surface, block._glow_blit_pos))
+                    append((self.tree_image, block._tree_blit_pos))
                     
                     # Display bush health if enabled
                     if const.BUSH_HEALTH_DISPLAY:
-                        # Create font if we don't have one
-                        if not hasattr(self, 'font'):
-                            self.font = pygame.font.SysFont(None, 20)
-                        
-                        # Render health text
-                        health_text = str(block.health)
-                        text_color = (255, 255, 255)  # White text
-                        health_surface = self.font.render(health_text, True, text_color)
+                        health_surface, bg_surface = self._get_health_label(block.health)
                         
                         # Position the health text at the top center of the bush
                         text_pos = (
@@ -513,18 +675,16 @@ class ScenarioManager:
                             y * const.GRID_SIZE - 2  # Position slightly above the top of the bush
                         )
                         
-                        # Draw a small dark background for better visibility
-                        bg_rect = health_surface.get_rect()
-                        bg_rect.topleft = text_pos
-                        bg_rect = bg_rect.inflate(4, 2)  # Make the background slightly larger
-                        bg_color = (0, 0, 0, 180)  # Semi-transparent black
-                        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                        bg_surface.fill(bg_color)
-                        surface.blit(bg_surface, bg_rect.topleft)
+                        # Draw the dark background centered behind the text for better visibility
+                        append((bg_surface, (text_pos[0] - 2, text_pos[1] - 1)))
                         
                         # Draw the health text
-                        surface.blit(health_surface, text_pos)
+                        append((health_surface, text_pos))
                 else:
+                    # Shapes below are drawn directly, so flush queued blits first to keep the order
+                    if blit_list:
+                        surface.blits(blit_list, doreturn=False)
+                        blit_list.clear()
                     # Fallback to original circular bush
                     center = (x * const.GRID_SIZE + const.GRID_SIZE//2, y * const.GRID_SIZE + const.GRID_SIZE//2)
                     # Color tint based on owner
@@ -539,10 +699,7 @@ class ScenarioManager:
                     
                     # Display bush health for fallback rendering too
                     if const.BUSH_HEALTH_DISPLAY:
-                        if not hasattr(self, 'font'):
-                            self.font = pygame.font.SysFont(None, 20)
-                        health_text = str(block.health)
-                        text_surface = self.font.render(health_text, True, (255, 255, 255))
+                        text_surface = self._get_health_label(block.health)[0]
                         text_pos = (
                             center[0] - text_surface.get_width() // 2,
                             y * const.GRID_SIZE - 2
@@ -550,7 +707,9 @@ class ScenarioManager:
                         surface.blit(text_surface, text_pos)
                 continue
             # Skip destroyed blocks unless fading
-            if block.is_destroyed and not block.is_fading:
+            if block.health <= 0 and not block.is_fading:
                 continue
             # Draw normal block
-            block.draw(surface)
\ No newline at end of file
+            append(block.get_blit())
+        
+        return blit_list
\ No newline at end of file
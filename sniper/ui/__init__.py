@@ -5,5 +5,6 @@ This package contains UI rendering and interface elements.
 """
 
 from .rendering import UI
+from .fonts import CachedFont
 
-__all__ = ['UI']
\ No newline at end of file
+__all__ = ['UI', 'CachedFont']
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Font helpers for the Sniper Game.
+"""
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import pygame
+
+class CachedFont:
+    """
+    Wraps a pygame font and memoizes rendered text surfaces.
+    
+    Most HUD labels only change when the game state does, so rendering them
+    through this wrapper turns per-frame rasterization into a dict lookup.
+    Any other attribute access is forwarded to the wrapped font.
+    """
+    
+    def __init__(self, font: pygame.font.Font, max_entries: int = 128):
+        """Initialize the cache around an existing font."""
+        self.font = font
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+    
+    def render(self, text: str, antialias: bool, color: Tuple[int, ...],
+               background: Optional[Tuple[int, ...]] = None) -> pygame.Surface:
+        """Render text, reusing the surface from a previous identical call."""
+        key = (text, antialias, color, background)
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)
+            return surface
+        
+        surface = self.font.render(text, antialias, color, background)
+        self._cache[key] = surface
+        # Drop the least recently used entry once the cache is full
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return surface
+    
+    def __getattr__(self, name: str) -> Any:
+        """Forward everything else (size, get_height, ...) to the wrapped font."""
+        return getattr(self.font, name)
@@ -9,6 +9,7 @@ from sniper.config.constants import const, debug_print
 from sniper.models.characters import Character
 from sniper.models.projectiles import Projectile
 from sniper.models.ui_elements import Button
+from sniper.utils import load_image
 
 class UI:
     """Handles rendering of UI elements and game state visualization."""
@@ -18,10 +19,18 @@ class UI:
         self.surface = surface
         self.fonts = fonts
         self.show_commands = False  # Add toggle for commands visibility
+        self._background = None  # Cached space background + grid
+        self._projectile_sprites = {}  # Pre-drawn projectile circles by color
+        self._scaled_sprites = {}  # Character sprites scaled for portraits/selection by (sprite, size)
+        self._enemy_info_bg = None  # Rounded enemy info box background, drawn once
+        self._panels = {}  # Translucent panel and overlay fills by (size, color)
+        # Clickable rects depend only on screen state, so compute them once per state
+        self._menu_layout_cache = {}
+        self._char_select_layout_cache = {}
         
         # Load tree image
         try:
-            self.tree_image = pygame.image.load("assets/tree.png").convert_alpha()
+            self.tree_image = load_image("tree.png")
             # Scale it to fit in a grid cell (slightly smaller than grid size)
             scale_size = int(const.GRID_SIZE * 0.9)
             self.tree_image = pygame.transform.scale(self.tree_image, (scale_size, scale_size))
@@ -44,7 +53,6 @@ class UI:
         
         # Draw stars if we haven't generated them yet
         if not hasattr(self, '_stars'):
-            import random
             self._stars = []
             # Generate 100 stars with random positions and sizes
             for _ in range(100):
@@ -63,6 +71,16 @@ class UI:
                 size
             )
             
+    def draw_background(self) -> None:
+        """Draw the space background and grid, rendering them only once."""
+        if self._background is None:
+            # Both layers are static, so render them once and keep a copy
+            self.draw_space_background()
+            self.draw_grid()
+            self._background = self.surface.copy()
+        else:
+            self.surface.blit(self._background, (0, 0))
+            
     def draw_obstacles(self, obstacles: List[Tuple[int, int]]) -> None:
         """
         Draw obstacles on the grid.
@@ -94,10 +112,48 @@ class UI:
     
     def draw_projectiles(self, projectiles: List[Projectile]) -> None:
         """Draw active projectiles."""
+        if not projectiles:
+            return
+        
+        radius = const.PROJECTILE_RADIUS
+        grid_size = const.GRID_SIZE
+        blit_list = []
         for p in projectiles:
-            center_x = int((p.x + 0.5) * const.GRID_SIZE)
-            center_y = int((p.y + 0.5) * const.GRID_SIZE)
-            pygame.draw.circle(self.surface, p.color, (center_x, center_y), const.PROJECTILE_RADIUS)
+            center_x = int((p.x + 0.5) * grid_size)
+            center_y = int((p.y + 0.5) * grid_size)
+            blit_list.append((self._get_projectile_sprite(p.color), (center_x - radius, center_y - radius)))
+        
+        # Single call so the per-projectile blitting happens on the C side
+        self.surface.blits(blit_list, doreturn=False)
+    
+    def _get_projectile_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Return a cached projectile circle for the given color."""
+        sprite = self._projectile_sprites.get(color)
+        if sprite is None:
+            radius = const.PROJECTILE_RADIUS
+            sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self._projectile_sprites[color] = sprite
+        return sprite
+    
+    def _get_scaled_sprite(self, sprite: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
+        """Return the sprite scaled to size, scaling it only the first time."""
+        key = (sprite, size)
+        scaled = self._scaled_sprites.get(key)
+        if scaled is None:
+            scaled = pygame.transform.scale(sprite, size)
+            self._scaled_sprites[key] = scaled
+        return scaled
+    
+    def _get_panel(self, size: Tuple[int, int], color: Tuple[int, int, int, int]) -> pygame.Surface:
+        """Return a cached translucent surface of the given size filled with color."""
+        key = (size, color)
+        panel = self._panels.get(key)
+        if panel is None:
+            panel = pygame.Surface(size, pygame.SRCALPHA)
+            panel.fill(color)
+            self._panels[key] = panel
+        return panel
     
     def draw_hud_grid(self, player: Character, enemy: Character, player_turn: bool = True) -> None:
         """Draw HUD with player and enemy info."""
@@ -228,8 +284,7 @@ class UI:
         """Draw debug information."""
         # Create a semi-transparent background for the debug info
         debug_bg = pygame.Rect(10, const.SCREEN_HEIGHT - 150, 300, 140)
-        bg_surface = pygame.Surface((debug_bg.width, debug_bg.height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 180))  # Semi-transparent black
+        bg_surface = self._get_panel(debug_bg.size, (0, 0, 0, 180))  # Semi-transparent black
         self.surface.blit(bg_surface, debug_bg)
         
         # Show AI state status
@@ -269,8 +324,7 @@ class UI:
         
         # Draw a semi-transparent background for better readability
         bg_rect = pygame.Rect(5, const.SCREEN_HEIGHT - 165, 210, 80)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 180))  # Semi-transparent black
+        bg_surface = self._get_panel(bg_rect.size, (0, 0, 0, 180))  # Semi-transparent black
         self.surface.blit(bg_surface, bg_rect)
         
         y_offset = const.SCREEN_HEIGHT - 160
@@ -353,71 +407,69 @@ class UI:
         title_rect = title_text.get_rect(center=(const.SCREEN_WIDTH // 2, 140))
         self.surface.blit(title_text, title_rect)
         
-        # Return all clickable elements
-        buttons = []
+        showing_submenu = getattr(self, 'showing_play_submenu', False)
+        buttons = self.layout_menu()
         
-        # Check if we're showing the main menu or submenu
-        if not hasattr(self, 'showing_play_submenu') or not self.showing_play_submenu:
-            # Main menu buttons
-            button_options = ["PLAY", "OPTIONS", "LEADERBOARD", "EXIT"]
-            y_offset = 250
-            
-            for option in button_options:
-                # Create button background
-                button_bg_rect = pygame.Rect(
-                    const.SCREEN_WIDTH // 2 - 175,
-                    y_offset,
-                    350,
-                    70
-                )
-                pygame.draw.rect(self.surface, (80, 30, 20), button_bg_rect)  # Brown color
-                pygame.draw.rect(self.surface, (200, 160, 80), button_bg_rect, 3)  # Gold border
-                
-                # Create button text
-                button_text = self.fonts['big'].render(option, True, (220, 180, 100))  # Golden color
-                button_text_rect = button_text.get_rect(center=(const.SCREEN_WIDTH // 2, y_offset + 35))
-                self.surface.blit(button_text, button_text_rect)
-                
-                buttons.append((button_bg_rect, option))
-                y_offset += 90  # Closer spacing to fit all buttons
-        else:
-            # Back button
-            back_rect = pygame.Rect(20, 20, 100, 40)
-            pygame.draw.rect(self.surface, (80, 30, 20), back_rect)  # Brown color
-            pygame.draw.rect(self.surface, (200, 160, 80), back_rect, 2)  # Gold border
-            back_text = self.fonts['normal'].render("< BACK", True, (220, 180, 100))
-            back_text_rect = back_text.get_rect(center=(70, 40))
-            self.surface.blit(back_text, back_text_rect)
-            buttons.append((back_rect, "BACK_TO_MENU"))
-            
+        if showing_submenu:
             # Play submenu title
             submenu_text = self.fonts['big'].render("GAME MODE", True, (220, 180, 100))
             submenu_rect = submenu_text.get_rect(center=(const.SCREEN_WIDTH // 2, 220))
             self.surface.blit(submenu_text, submenu_rect)
+        
+        for button_rect, option in buttons:
+            if option == "BACK_TO_MENU":
+                # Back button
+                pygame.draw.rect(self.surface, (80, 30, 20), button_rect)  # Brown color
+                pygame.draw.rect(self.surface, (200, 160, 80), button_rect, 2)  # Gold border
+                back_text = self.fonts['normal'].render("< BACK", True, (220, 180, 100))
+                back_text_rect = back_text.get_rect(center=button_rect.center)
+                self.surface.blit(back_text, back_text_rect)
+                continue
             
+            # Create button background
+            pygame.draw.rect(self.surface, (80, 30, 20), button_rect)  # Brown color
+            pygame.draw.rect(self.surface, (200, 160, 80), button_rect, 3)  # Gold border
+            
+            # Create button text - submenu options are longer, so use the smaller font
+            font = self.fonts['normal'] if showing_submenu else self.fonts['big']
+            button_text = font.render(option, True, (220, 180, 100))  # Golden color
+            button_text_rect = button_text.get_rect(center=button_rect.center)
+            self.surface.blit(button_text, button_text_rect)
+        
+        return buttons
+        
+    def layout_menu(self) -> List[Tuple[pygame.Rect, str]]:
+        """Return the clickable menu buttons for the current menu page without drawing."""
+        showing_submenu = getattr(self, 'showing_play_submenu', False)
+        buttons = self._menu_layout_cache.get(showing_submenu)
+        if buttons is not None:
+            return buttons
+        
+        buttons = []
+        if not showing_submenu:
+            # Main menu buttons
+            button_options = ["PLAY", "OPTIONS", "LEADERBOARD", "EXIT"]
+            y_offset = 250
+            spacing = 90  # Closer spacing to fit all buttons
+        else:
+            # Back button
+            buttons.append((pygame.Rect(20, 20, 100, 40), "BACK_TO_MENU"))
             # Play options
-            play_options = ["PLAYER VS AI", "PLAYER VS PLAYER"]
+            button_options = ["PLAYER VS AI", "PLAYER VS PLAYER"]
             y_offset = 300
-            
-            for option in play_options:
-                # Create button background
-                button_bg_rect = pygame.Rect(
-                    const.SCREEN_WIDTH // 2 - 175,
-                    y_offset,
-                    350,
-                    70
-                )
-                pygame.draw.rect(self.surface, (80, 30, 20), button_bg_rect)  # Brown color
-                pygame.draw.rect(self.surface, (200, 160, 80), button_bg_rect, 3)  # Gold border
-                
-                # Create button text
-                button_text = self.fonts['normal'].render(option, True, (220, 180, 100))  # Golden color
-                button_text_rect = button_text.get_rect(center=(const.SCREEN_WIDTH // 2, y_offset + 35))
-                self.surface.blit(button_text, button_text_rect)
-                
-                buttons.append((button_bg_rect, option))
-                y_offset += 100
+            spacing = 100
+        
+        for option in button_options:
+            button_bg_rect = pygame.Rect(
+                const.SCREEN_WIDTH // 2 - 175,
+                y_offset,
+                350,
+                70
+            )
+            buttons.append((button_bg_rect, option))
+            y_offset += spacing
         
+        self._menu_layout_cache[showing_submenu] = buttons
         return buttons
         
     def toggle_play_submenu(self, show: bool = None) -> None:
@@ -465,28 +517,23 @@ class UI:
         title_rect = title_text.get_rect(center=(const.SCREEN_WIDTH // 2, 50))
         self.surface.blit(title_text, title_rect)
         
-        clickable_elements = []
-        
-        # Calculate spacing between character boxes
-        num_characters = len(sniper_types)
-        total_width = num_characters * 180 + (num_characters - 1) * 20  # 180px per char, 20px spacing
-        start_x = (const.SCREEN_WIDTH - total_width) // 2
+        clickable_elements = self.layout_character_select(stage, selected, sniper_types)
         
         # Draw character options
-        for i, sniper_type in enumerate(sniper_types):
-            # Calculate position
-            x_pos = start_x + i * 200  # 180px box + 20px spacing
-            y_pos = 150  # Start y position for character boxes
+        for char_rect, element_type, i in clickable_elements:
+            if element_type != "character":
+                continue
+            sniper_type = sniper_types[i]
+            x_pos, y_pos = char_rect.topleft
             
             # Character box background
-            char_rect = pygame.Rect(x_pos, y_pos, 180, 180)
             bg_color = (200, 200, 200) if selected == sniper_type else (100, 100, 100)
             pygame.draw.rect(self.surface, bg_color, char_rect)
             
             # Character sprite
             sprite_rect = pygame.Rect(x_pos + 25, y_pos + 25, 130, 130)
-            if hasattr(sniper_type, 'sprite') and sniper_type.sprite:
-                scaled_sprite = pygame.transform.scale(sniper_type.sprite, (130, 130))
+            if sniper_type.sprite:
+                scaled_sprite = self._get_scaled_sprite(sniper_type.sprite, (130, 130))
                 self.surface.blit(scaled_sprite, sprite_rect)
             else:
                 # Draw a colored rectangle if no sprite
@@ -501,34 +548,58 @@ class UI:
             desc_text = self.fonts['normal'].render(sniper_type.description, True, const.WHITE)
             desc_rect = desc_text.get_rect(center=(x_pos + 90, y_pos + 240))
             self.surface.blit(desc_text, desc_rect)
-            
-            # Add to clickable elements
-            clickable_elements.append((char_rect, "character", i))
         
         # Draw select button if character is selected
         if selected:
-            select_button_rect = pygame.Rect(
-                const.SCREEN_WIDTH // 2 - 150,
-                const.SCREEN_HEIGHT - 100,
-                300,
-                70
-            )
+            select_button_rect = clickable_elements[-1][0]
             pygame.draw.rect(self.surface, (200, 200, 200), select_button_rect)
             pygame.draw.rect(self.surface, (50, 50, 50), select_button_rect, 2)
             
             button_text = self.fonts['normal'].render(f"Select {selected.name}", True, (0, 0, 0))
             button_text_rect = button_text.get_rect(center=(const.SCREEN_WIDTH // 2, const.SCREEN_HEIGHT - 65))
             self.surface.blit(button_text, button_text_rect)
-            
+        
+        return clickable_elements
+    
+    def layout_character_select(self, stage: str, selected: Optional[Any],
+                                sniper_types: List) -> List[Tuple[pygame.Rect, str, int]]:
+        """Return the clickable elements of the character selection screen without drawing."""
+        # Only the number of characters and whether one is selected move the rects
+        key = (stage, selected is not None, len(sniper_types))
+        clickable_elements = self._char_select_layout_cache.get(key)
+        if clickable_elements is not None:
+            return clickable_elements
+        
+        clickable_elements = []
+        
+        # Calculate spacing between character boxes
+        num_characters = len(sniper_types)
+        total_width = num_characters * 180 + (num_characters - 1) * 20  # 180px per char, 20px spacing
+        start_x = (const.SCREEN_WIDTH - total_width) // 2
+        
+        for i in range(num_characters):
+            # Calculate position
+            x_pos = start_x + i * 200  # 180px box + 20px spacing
+            y_pos = 150  # Start y position for character boxes
+            clickable_elements.append((pygame.Rect(x_pos, y_pos, 180, 180), "character", i))
+        
+        # Select button is only shown once a character is selected
+        if selected:
+            select_button_rect = pygame.Rect(
+                const.SCREEN_WIDTH // 2 - 150,
+                const.SCREEN_HEIGHT - 100,
+                300,
+                70
+            )
             clickable_elements.append((select_button_rect, "select_button", None))
         
+        self._char_select_layout_cache[key] = clickable_elements
         return clickable_elements
     
     def draw_confirmation_popup(self) -> None:
         """Draw a confirmation popup."""
         # Darken the screen
-        overlay = pygame.Surface((const.SCREEN_WIDTH, const.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
+        overlay = self._get_panel((const.SCREEN_WIDTH, const.SCREEN_HEIGHT), (0, 0, 0, 128))
         self.surface.blit(overlay, (0, 0))
         
         # Draw popup box
@@ -622,8 +693,8 @@ class UI:
         pygame.draw.rect(self.surface, panel_border_color, portrait_rect, 2)  # Border using character color
 
         # Display player portrait if available
-        if hasattr(player, 'sniper_type') and hasattr(player.sniper_type, 'sprite') and player.sniper_type.sprite:
-            scaled_sprite = pygame.transform.scale(player.sniper_type.sprite, (portrait_size - 10, portrait_size - 10))
+        if player.sniper_type.sprite:
+            scaled_sprite = self._get_scaled_sprite(player.sniper_type.sprite, (portrait_size - 10, portrait_size - 10))
             self.surface.blit(scaled_sprite, (portrait_rect.x + 5, portrait_rect.y + 5))
 
         # Player name just right of the portrait
@@ -800,24 +871,27 @@ class UI:
         x = max(10, min(x, const.SCREEN_WIDTH - info_width - 10))
         y = max(45, min(y, const.SCREEN_HEIGHT - info_height - 10))
         
-        # Create a semi-transparent background with rounded corners and margin
-        info_bg = pygame.Surface((info_width + margin*2, info_height + margin*2), pygame.SRCALPHA)
-        
-        # First, draw a rounded rectangle on this surface
-        radius = 10  # Corner radius
-        rect = pygame.Rect(margin, margin, info_width, info_height)
-        
-        # Draw the semi-transparent background with rounded corners
-        pygame.draw.rect(info_bg, (10, 10, 20, 210), rect, border_radius=radius)
-        
-        # Draw a gold border with rounded corners
-        pygame.draw.rect(info_bg, (220, 180, 100), rect, 2, border_radius=radius)
+        # The background never changes, so only build it the first time
+        if self._enemy_info_bg is None:
+            # Create a semi-transparent background with rounded corners and margin
+            info_bg = pygame.Surface((info_width + margin*2, info_height + margin*2), pygame.SRCALPHA)
+            
+            # First, draw a rounded rectangle on this surface
+            radius = 10  # Corner radius
+            rect = pygame.Rect(margin, margin, info_width, info_height)
+            
+            # Draw the semi-transparent background with rounded corners
+            pygame.draw.rect(info_bg, (10, 10, 20, 210), rect, border_radius=radius)
+            
+            # Draw a gold border with rounded corners
+            pygame.draw.rect(info_bg, (220, 180, 100), rect, 2, border_radius=radius)
+            self._enemy_info_bg = info_bg
         
         # Blit the background to the main surface
-        self.surface.blit(info_bg, (x - margin, y - margin))
+        self.surface.blit(self._enemy_info_bg, (x - margin, y - margin))
         
         # Use a smaller font for more compact display
-        small_font = pygame.font.SysFont(None, 20)  # Smaller font size
+        small_font = self.fonts['small']
         
         # Enemy name - use actual enemy name if available - now with WHITE color
         name = enemy.sniper_type.name if hasattr(enemy, 'sniper_type') else "Enemy"
@@ -891,9 +965,8 @@ class UI:
         
     def draw_countdown(self, seconds: int) -> None:
         """Draw a round transition countdown in the center of the screen."""
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((const.SCREEN_WIDTH, const.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill(const.ROUND_TRANSITION_BG_COLOR)
+        # Semi-transparent overlay
+        overlay = self._get_panel((const.SCREEN_WIDTH, const.SCREEN_HEIGHT), const.ROUND_TRANSITION_BG_COLOR)
         self.surface.blit(overlay, (0, 0))
         
         # Draw the round number
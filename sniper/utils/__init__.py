@@ -4,6 +4,6 @@ Utilities module for the Sniper Game.
 This package contains helper functions and utility code.
 """
 
-from .helpers import load_image, scale_to_fit, manhattan_distance
+from .helpers import load_image, scale_to_fit, manhattan_distance, cardinal_direction
 
-__all__ = ['load_image', 'scale_to_fit', 'manhattan_distance']
\ No newline at end of file
+__all__ = ['load_image', 'scale_to_fit', 'manhattan_distance', 'cardinal_direction']
\ No newline at end of file
@@ -69,4 +69,20 @@ def manhattan_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
     Returns:
         Manhattan distance between pos1 and pos2
     """
-    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
\ No newline at end of file
+    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+
+def cardinal_direction(dx: float, dy: float) -> Tuple[int, int]:
+    """
+    Snap a direction vector to the nearest cardinal unit step.
+    
+    Args:
+        dx: Horizontal component
+        dy: Vertical component
+        
+    Returns:
+        (step_x, step_y) with exactly one non-zero component of +/-1
+    """
+    # Only the signs and relative magnitudes matter, so no normalization is needed
+    if abs(dx) > abs(dy):
+        return (1 if dx > 0 else -1, 0)
+    return (0, 1 if dy > 0 else -1)